@@ -2,29 +2,61 @@
 # Nessie: Node Environment Support Script for Inspection and Export
 # Collects logs and configurations from SUSE Kubernetes environments
 
+import io
 import os
+import gzip
+import json
 import yaml
+import asyncio
 import time
 import logging
 import shutil
 import tarfile
+import functools
 import subprocess
-from datetime import datetime, timedelta
-from kubernetes import client, config
+import urllib3
+import concurrent.futures
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from kubernetes import client, config, watch
 from pathlib import Path
 
+# Prefer the libyaml C emitter, it is an order of magnitude faster than pure Python
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
 # Configuration from environment variables with defaults
 LOG_DIR = os.environ.get('NESSIE_LOG_DIR', '/tmp')
 ZIP_DIR = os.environ.get('NESSIE_ZIP_DIR', f"{LOG_DIR}/archives")
 MAX_LOG_SIZE = int(os.environ.get('NESSIE_MAX_LOG_SIZE', '1024')) * 1024 * 1024
 RETENTION_DAYS = int(os.environ.get('NESSIE_RETENTION_DAYS', '30'))
 MAX_POD_LOG_LINES = int(os.environ.get('NESSIE_MAX_POD_LOG_LINES', '1000'))
+POD_LIST_PAGE_SIZE = 500
+NAMESPACE_LIST_PAGE_SIZE = 500
+LOG_CHUNK_SIZE = 64 * 1024
+ARCHIVE_BUFFER_SIZE = 1024 * 1024
+API_POOL_SIZE = 64
+MIN_FREE_SPACE = 100 * 1024 * 1024
+LOW_FREE_SPACE_PERCENT = 10
+LOG_WORKERS = max(1, int(os.environ.get('NESSIE_LOG_WORKERS', '50')))
+
+# Optional state file that lets repeated runs only fetch logs of pods changed since the last run
+WATCH_CACHE = os.environ.get('NESSIE_WATCH_CACHE', '')
+
+# Optional state file that limits pod logs to lines written since the previous run
+LAST_RUN_FILE = os.environ.get('NESSIE_LAST_RUN_FILE', '')
 
 # Namespace filtering
 NAMESPACES_FILTER = os.environ.get('NESSIE_NAMESPACES', '').split(',') if os.environ.get('NESSIE_NAMESPACES') else None
 if NAMESPACES_FILTER and len(NAMESPACES_FILTER) == 1 and NAMESPACES_FILTER[0] == '':
     NAMESPACES_FILTER = None
 
+# Label selector restricting which pods logs are collected from
+POD_LABEL_SELECTOR = os.environ.get('NESSIE_POD_LABEL_SELECTOR', '')
+
 # Skip flags and verbosity
 VERBOSE = int(os.environ.get('NESSIE_VERBOSE', '0'))
 SKIP_NODE_LOGS = os.environ.get('NESSIE_SKIP_NODE_LOGS', '').lower() in ('true', 'yes', '1', 'on')
@@ -38,38 +70,64 @@ log_level = max(logging.WARNING - (VERBOSE * 10), logging.DEBUG)
 logging.basicConfig(level=log_level, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Asks for PartialObjectMetadataList, servers without it fall back to the full list
+PARTIAL_METADATA_ACCEPT = "application/json;as=PartialObjectMetadataList;v=v1;g=meta.k8s.io,application/json"
+
+# Ironic and Metal3 journals for bare metal provisioning
+METAL3_LOG_COMMAND = ["journalctl", "-u", "ironic", "-u", "metal3", "-n", "1000", "--no-pager"]
+
 # Service logs to collect
 NODE_SERVICES = {
-    "system": "journalctl -n 1000 --no-pager",
-    "combustion": "journalctl -u combustion --no-pager",
-    "hauler": "journalctl -u hauler --no-pager",
-    "nmc": "journalctl -u nm-configurator --no-pager"
+    "system": ["journalctl", "-n", "1000", "--no-pager"],
+    "combustion": ["journalctl", "-u", "combustion", "--no-pager"],
+    "hauler": ["journalctl", "-u", "hauler", "--no-pager"],
+    "nmc": ["journalctl", "-u", "nm-configurator", "--no-pager"]
 }
 
 # Commands to retrieve version information
 VERSION_COMMANDS = {
-    "helm": "helm version --short",
-    "kubectl": "kubectl version",
-    "upgrade-controller": "kubectl get deployment system-upgrade-controller -n cattle-system -o jsonpath='{.spec.template.spec.containers[0].image}'",
-    "endpoint-copier-operator": "kubectl get deployment endpoint-copier-operator -n endpoint-copier-operator -o jsonpath='{.spec.template.spec.containers[0].image}'",
-    "metallb": "kubectl get deployment metallb-controller -n metallb-system -o jsonpath='{.spec.template.spec.containers[*].image}'"
+    "helm": ["helm", "version", "--short"],
+    "kubectl": ["kubectl", "version"]
+}
+
+# Deployments whose images identify component versions: (namespace, name, include all containers)
+DEPLOYMENT_IMAGES = {
+    "upgrade-controller": ("cattle-system", "system-upgrade-controller", False),
+    "endpoint-copier-operator": ("endpoint-copier-operator", "endpoint-copier-operator", False),
+    "metallb": ("metallb-system", "metallb-controller", True)
 }
 
 class ProgressTracker:
     """Tracks progress of long-running operations"""
+    # Log roughly every 5% of the items, or at least once per interval
+    LOG_STEPS = 20
+    LOG_INTERVAL = 1.0
+    
     def __init__(self, total_items, operation_name):
         self.total = total_items
         self.current = 0
         self.operation_name = operation_name
         self.start_time = time.time()
+        self.step = max(1, total_items // self.LOG_STEPS)
+        self.next_log_at = self.step
+        self.last_log_time = self.start_time
         logger.info(f"Starting {operation_name} (0/{total_items})")
     
     def update(self, increment=1):
-        """Updates progress counter and logs status"""
+        """Updates progress counter and logs status when due"""
         self.current += increment
-        percent = (self.current / self.total) * 100
-        elapsed = time.time() - self.start_time
-        logger.info(f"{self.operation_name} progress: {self.current}/{self.total} ({percent:.1f}%) - {elapsed:.1f}s elapsed")
+        # Called once per item, skip the clock and throttling checks when nothing would be logged
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        now = time.time()
+        if self.current < self.next_log_at and self.current < self.total and now - self.last_log_time < self.LOG_INTERVAL:
+            return
+        
+        self.next_log_at = self.current + self.step
+        self.last_log_time = now
+        percent = (self.current / self.total) * 100 if self.total else 100.0
+        logger.info(f"{self.operation_name} progress: {self.current}/{self.total} ({percent:.1f}%) - {now - self.start_time:.1f}s elapsed")
     
     def complete(self):
         """Marks operation as complete and returns duration"""
@@ -92,7 +150,10 @@ def ensure_directories():
         return False
 
 def setup_kubernetes_client():
-    """Initializes Kubernetes API clients with support for SUSE K8s variants"""
+    """Initializes Kubernetes API clients with support for SUSE K8s variants
+    
+    Returns the shared ApiClient followed by the API clients built on it.
+    """
     # Possible Kubernetes config locations
     kubeconfig_locations = [
         os.environ.get('KUBECONFIG'),  # KUBECONFIG env var
@@ -131,17 +192,27 @@ def setup_kubernetes_client():
         
         if not loaded:
             logger.error("Failed to find or load any Kubernetes configuration")
-            return None, None
+            return None, None, None, None
+    
+    # Share one connection pool between all API clients and threads so HTTPS connections get reused,
+    # sized for the parallel pod log fetches and retrying when the API server throttles us
+    kube_config = client.Configuration.get_default_copy()
+    kube_config.connection_pool_maxsize = max(API_POOL_SIZE, LOG_WORKERS)
+    kube_config.retries = urllib3.Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 503], raise_on_status=False)
+    api_client = client.ApiClient(kube_config)
     
-    return client.CoreV1Api(), client.CustomObjectsApi()
+    return api_client, client.CoreV1Api(api_client), client.CustomObjectsApi(api_client), client.AppsV1Api(api_client)
+
+@functools.lru_cache(maxsize=None)
+def find_tool(name):
+    """Looks up an executable on PATH, which does not change while Nessie runs"""
+    return shutil.which(name)
 
-def run_command(command, shell=False):
-    """Runs a command safely and returns its output"""
+def run_command(command):
+    """Runs a command, given as an argument list, and returns its output"""
     try:
-        args = command if isinstance(command, list) else command
         result = subprocess.run(
-            args, 
-            shell=shell, 
+            command,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             universal_newlines=True,
@@ -156,103 +227,371 @@ def run_command(command, shell=False):
     except Exception as e:
         return False, f"Error executing command: {e}"
 
-def collect_node_logs():
-    """Collects logs from system services on the host node"""
-    logs = {}
-    progress = ProgressTracker(len(NODE_SERVICES), "Node log collection")
-    
-    for name, cmd in NODE_SERVICES.items():
-        success, output = run_command(cmd, shell=True)
-        logs[name] = output if success else f"Failed to collect logs: {output}"
-        progress.update()
+def run_command_to_file(command, output_file):
+    """Runs a command, streaming its output straight into a file instead of memory"""
+    try:
+        with open(output_file, "wb") as out:
+            result = subprocess.run(command, stdout=out, stderr=subprocess.PIPE, timeout=60)
+        if result.returncode == 0:
+            return True, None
+        else:
+            return False, f"Command failed with code {result.returncode}: {result.stderr.decode(errors='replace')}"
+    except subprocess.TimeoutExpired:
+        return False, "Command timed out after 60 seconds"
+    except Exception as e:
+        return False, f"Error executing command: {e}"
+
+async def run_command_async(command, timeout=60):
+    """Runs a command, given as an argument list, without blocking the event loop and returns its output"""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return False, f"Command timed out after {timeout} seconds"
+        if proc.returncode == 0:
+            return True, stdout.decode(errors="replace")
+        else:
+            return False, f"Command failed with code {proc.returncode}: {stderr.decode(errors='replace')}"
+    except Exception as e:
+        return False, f"Error executing command: {e}"
+
+async def run_command_to_file_async(command, output_file, timeout=60):
+    """Runs a command without blocking the event loop, streaming its output straight into a file"""
+    try:
+        with open(output_file, "wb") as out:
+            proc = await asyncio.create_subprocess_exec(*command, stdout=out, stderr=asyncio.subprocess.PIPE)
+            try:
+                _, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                return False, f"Command timed out after {timeout} seconds"
+        if proc.returncode == 0:
+            return True, None
+        else:
+            return False, f"Command failed with code {proc.returncode}: {stderr.decode(errors='replace')}"
+    except Exception as e:
+        return False, f"Error executing command: {e}"
+
+@dataclass
+class CollectResult:
+    """Outcome of collecting one item, the payload is the collected value or the failure message"""
+    __slots__ = ("ok", "payload", "source")
+    ok: bool
+    payload: str
+    source: str
+
+async def track_progress(awaitable, progress, increment=1):
+    """Awaits a coroutine and advances a progress tracker once it is done"""
+    result = await awaitable
+    progress.update(increment)
+    return result
+
+async def collect_journal(node_dir, name, command):
+    """Streams a journalctl command into the node log file of the given name"""
+    log_file = Path(node_dir) / f"{name}.log"
+    source = f"Node service '{name}'"
+    success, error = await run_command_to_file_async(command, log_file)
+    if success:
+        return CollectResult(True, "collected", source)
+    write_file(log_file, f"Failed to collect logs: {error}")
+    return CollectResult(False, f"Failed to collect logs: {error}", source)
+
+async def gather_node_logs(node_dir, progress):
+    """Runs every node service journalctl call concurrently on one event loop"""
+    results = await asyncio.gather(
+        *(track_progress(collect_journal(node_dir, name, cmd), progress) for name, cmd in NODE_SERVICES.items())
+    )
+    return dict(zip(NODE_SERVICES, results))
+
+def collect_node_logs(collection_dir):
+    """Collects logs from system services on the host node into the collection directory
     
+    Returns a CollectResult per log.
+    """
+    progress = ProgressTracker(len(NODE_SERVICES), "Node log collection")
+    logs = asyncio.run(gather_node_logs(Path(collection_dir) / "node", progress))
     progress.complete()
     return logs
 
-def collect_k8s_configs(v1_api):
+def list_namespace_names(v1_api):
+    """Lists namespace names, asking the API server for object metadata only"""
+    names = []
+    query_params = [("limit", NAMESPACE_LIST_PAGE_SIZE)]
+    while True:
+        response = v1_api.api_client.call_api(
+            "/api/v1/namespaces", "GET",
+            query_params=query_params,
+            # Let the API server gzip the list, reading response.data decodes it
+            header_params={"Accept": PARTIAL_METADATA_ACCEPT, "Accept-Encoding": "gzip"},
+            auth_settings=["BearerToken"],
+            _return_http_data_only=True,
+            _preload_content=False,
+            _request_timeout=30
+        )
+        namespace_list = json.loads(response.data)
+        names.extend(item["metadata"]["name"] for item in namespace_list.get("items", []))
+        continue_token = namespace_list.get("metadata", {}).get("continue")
+        if not continue_token:
+            break
+        query_params = [("limit", NAMESPACE_LIST_PAGE_SIZE), ("continue", continue_token)]
+    return names
+
+def collect_k8s_configs(v1_api, collection_dir):
     """Collects Kubernetes configuration and state information"""
     data = {}
     logger.info("Collecting Kubernetes configuration information")
     
     try:
         # Get namespaces
-        namespaces = v1_api.list_namespace()
-        data["namespaces"] = [ns.metadata.name for ns in namespaces.items]
+        data["namespaces"] = list_namespace_names(v1_api)
         logger.info(f"Collected information for {len(data['namespaces'])} namespaces")
         
         # Get Helm releases
-        success, helm_output = run_command(["helm", "list", "-A", "-o", "yaml"])
+        success, helm_output = run_command(["helm", "list", "-A", "-o", "json"])
         if success:
-            data["helm_releases"] = yaml.safe_load(helm_output)
+            data["helm_releases"] = json.loads(helm_output)
             logger.info(f"Collected information for {len(data['helm_releases']) if isinstance(data['helm_releases'], list) else 0} Helm releases")
         else:
             logger.warning(f"Failed to fetch Helm releases: {helm_output}")
             data["helm_releases"] = []
             
-        # Collect Metal3 logs
-        success, metal3_logs = run_command("journalctl -u ironic -u metal3 -n 1000 --no-pager", shell=True)
+        # Collect Metal3 logs straight into the collection directory
+        metal3_file = Path(collection_dir) / "configs" / "metal3.log"
+        success, error = run_command_to_file(METAL3_LOG_COMMAND, metal3_file)
         if success:
-            data["metal3_logs"] = metal3_logs
+            data["metal3_logs"] = "collected"
             logger.info("Collected Metal3 logs")
         else:
-            logger.warning(f"Failed to collect Metal3 logs: {metal3_logs}")
+            logger.warning(f"Failed to collect Metal3 logs: {error}")
             data["metal3_logs"] = "No Metal3 logs available"
+            write_file(metal3_file, data["metal3_logs"])
     except Exception as e:
         logger.error(f"Error collecting Kubernetes configs: {e}")
         data["error"] = str(e)
     
     return data
 
-def collect_pod_logs(v1_api):
-    """Collects logs from pods, optionally filtered by namespace"""
+def pod_selector_args():
+    """Returns the LIST/WATCH arguments that filter pods server-side"""
+    selector_args = {}
+    if POD_LABEL_SELECTOR:
+        selector_args["label_selector"] = POD_LABEL_SELECTOR
+    if NAMESPACES_FILTER and len(NAMESPACES_FILTER) == 1:
+        # A single namespace can be filtered server-side
+        selector_args["field_selector"] = f"metadata.namespace={NAMESPACES_FILTER[0]}"
+    return selector_args
+
+def filter_pods(pods):
+    """Applies the namespace filter to pods that could not be filtered server-side"""
+    if NAMESPACES_FILTER and len(NAMESPACES_FILTER) > 1:
+        namespaces = set(NAMESPACES_FILTER)
+        return [pod for pod in pods if pod.metadata.namespace in namespaces]
+    return pods
+
+def list_pods(v1_api):
+    """Lists pods with a single paged LIST call and returns them with the list resourceVersion"""
+    list_args = {"watch": False, "limit": POD_LIST_PAGE_SIZE, "timeout_seconds": 30, "_request_timeout": 30}
+    list_args.update(pod_selector_args())
+    
+    pods = []
+    resource_version = None
+    while True:
+        pod_list = v1_api.list_pod_for_all_namespaces(**list_args)
+        pods.extend(pod_list.items)
+        # All pages are served from the snapshot of the first one
+        resource_version = resource_version or pod_list.metadata.resource_version
+        continue_token = pod_list.metadata._continue
+        if not continue_token:
+            break
+        list_args["_continue"] = continue_token
+    
+    pods = filter_pods(pods)
+    if NAMESPACES_FILTER:
+        logger.info(f"Collected {len(pods)} pods from namespaces {', '.join(NAMESPACES_FILTER)}")
+    else:
+        logger.info(f"Collected {len(pods)} pods from all namespaces")
+    
+    return pods, resource_version
+
+def load_watch_cache():
+    """Loads the pod list resourceVersion saved by the previous run, if any"""
+    try:
+        with open(WATCH_CACHE) as f:
+            return json.load(f)["resource_version"]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Ignoring unreadable watch cache {WATCH_CACHE}: {e}")
+        return None
+
+def save_watch_cache(resource_version):
+    """Persists the pod list resourceVersion for the next run, if the watch cache is enabled"""
+    if not WATCH_CACHE or not resource_version:
+        return
+    tmp_file = f"{WATCH_CACHE}.tmp"
+    try:
+        with open(tmp_file, "w") as f:
+            json.dump({"resource_version": resource_version}, f)
+        os.replace(tmp_file, WATCH_CACHE)
+    except OSError as e:
+        logger.warning(f"Failed to save watch cache {WATCH_CACHE}: {e}")
+
+def list_changed_pods(v1_api):
+    """Lists pods changed since the previous run by replaying a watch from the cached resourceVersion
+    
+    Returns the pods along with the resourceVersion to save once the run has succeeded.
+    """
+    resource_version = load_watch_cache()
+    if resource_version is None:
+        return list_pods(v1_api)
+    
+    changed = {}
+    deleted = 0
+    pod_watch = watch.Watch()
+    try:
+        for event in pod_watch.stream(
+            v1_api.list_pod_for_all_namespaces,
+            resource_version=resource_version,
+            allow_watch_bookmarks=True,
+            timeout_seconds=5,
+            **pod_selector_args()
+        ):
+            if event["type"] == "BOOKMARK":
+                continue
+            
+            pod = event["object"]
+            pod_key = f"{pod.metadata.namespace}/{pod.metadata.name}"
+            if event["type"] == "DELETED":
+                changed.pop(pod_key, None)
+                deleted += 1
+            else:
+                changed[pod_key] = pod
+    except client.rest.ApiException as e:
+        if e.status != 410:
+            raise
+        # The cached resourceVersion was compacted away (the watch raises 410 Gone), start over with a full list
+        logger.warning("Watch cache is too old, falling back to a full pod list")
+        return list_pods(v1_api)
+    
+    pods = filter_pods(list(changed.values()))
+    logger.info(f"Collected {len(pods)} changed pods since the last run ({deleted} deleted)")
+    # A watch only reports object changes, new log lines of an otherwise unchanged pod do not show up
+    logger.warning("Watch cache enabled, skipping logs of pods that did not change since the last run")
+    return pods, pod_watch.resource_version
+
+def load_last_run():
+    """Returns the start time of the previous run, if incremental collection is enabled"""
+    if not LAST_RUN_FILE:
+        return None
+    try:
+        with open(LAST_RUN_FILE) as f:
+            return float(f.read().strip())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable last run file {LAST_RUN_FILE}: {e}")
+        return None
+
+def save_last_run(timestamp):
+    """Records the start time of this run for the next incremental collection"""
+    if not LAST_RUN_FILE:
+        return
+    try:
+        Path(LAST_RUN_FILE).parent.mkdir(exist_ok=True, parents=True)
+        write_file(LAST_RUN_FILE, f"{timestamp}\n")
+    except OSError as e:
+        logger.warning(f"Failed to save last run file {LAST_RUN_FILE}: {e}")
+
+def fetch_container_log(v1_api, namespace, pod_name, container, log_file, since_seconds=None):
+    """Streams the log of a single container straight to a file and returns the error, if any"""
+    error = None
+    try:
+        log_args = {"since_seconds": since_seconds} if since_seconds else {}
+        response = v1_api.read_namespaced_pod_log(
+            name=pod_name,
+            namespace=namespace,
+            container=container,
+            tail_lines=MAX_POD_LOG_LINES,
+            _preload_content=False,
+            _request_timeout=30,
+            **log_args
+        )
+        try:
+            with open(log_file, "wb") as f:
+                shutil.copyfileobj(response, f, length=LOG_CHUNK_SIZE)
+        finally:
+            response.release_conn()
+    except Exception as e:
+        error = str(e)
+        write_file(log_file, f"Error: {error}")
+    return namespace, pod_name, container, error
+
+def collect_pod_logs(v1_api, collection_dir):
+    """Collects logs from pods into the collection directory, optionally filtered by namespace
+    
+    Returns the containers collected per (namespace, pod), a list of failed CollectResults and
+    the pod list resourceVersion for the watch cache.
+    """
     pod_logs = {}
+    errors = []
+    resource_version = None
     
     try:
-        # Get pods with optional namespace filtering
-        if NAMESPACES_FILTER:
-            pods = []
-            for ns in NAMESPACES_FILTER:
-                try:
-                    ns_pods = v1_api.list_namespaced_pod(ns).items
-                    pods.extend(ns_pods)
-                    logger.info(f"Collected {len(ns_pods)} pods from namespace {ns}")
-                except Exception as e:
-                    logger.warning(f"Failed to get pods in namespace {ns}: {e}")
+        if WATCH_CACHE:
+            pods, resource_version = list_changed_pods(v1_api)
         else:
-            pods = v1_api.list_pod_for_all_namespaces(watch=False).items
-            logger.info(f"Collected {len(pods)} pods from all namespaces")
-        
-        progress = ProgressTracker(len(pods), "Pod log collection")
+            pods, resource_version = list_pods(v1_api)
         
-        # Collect logs from each container in each pod
+        # Build the list of containers to fetch logs from, creating each namespace directory
+        # once here so the log writers only open their own files
+        targets = []
+        ns_dirs = {}
         for pod in pods:
             pod_name = pod.metadata.name
             namespace = pod.metadata.namespace
-            containers = [c.name for c in pod.spec.containers]
-            
-            pod_logs[f"{namespace}/{pod_name}"] = {}
-            
-            for container in containers:
-                try:
-                    log_data = v1_api.read_namespaced_pod_log(
-                        name=pod_name,
-                        namespace=namespace,
-                        container=container,
-                        tail_lines=MAX_POD_LOG_LINES
-                    )
-                    pod_logs[f"{namespace}/{pod_name}"][container] = log_data
-                except Exception as e:
-                    pod_logs[f"{namespace}/{pod_name}"][container] = f"Error: {str(e)}"
-            
-            progress.update()
+            pod_logs[(namespace, pod_name)] = []
+            ns_dir = ns_dirs.get(namespace)
+            if ns_dir is None:
+                ns_dir = ns_dirs[namespace] = Path(collection_dir) / "pods" / namespace
+                ns_dir.mkdir(exist_ok=True, parents=True)
+            for c in pod.spec.containers:
+                targets.append((namespace, pod_name, c.name, ns_dir / f"{pod_name}_{c.name}.log"))
+        
+        # Only fetch log lines written since the previous run when incremental collection is enabled
+        since_seconds = None
+        last_run = load_last_run()
+        if last_run:
+            since_seconds = max(1, int(time.time() - last_run))
+            logger.info(f"Collecting pod logs from the last {since_seconds}s since the previous run")
+        
+        progress = ProgressTracker(len(targets), "Pod log collection")
+        
+        # Fetch container logs concurrently, the calls are bound by API server round-trips
+        with concurrent.futures.ThreadPoolExecutor(max_workers=LOG_WORKERS) as executor:
+            futures = [
+                executor.submit(fetch_container_log, v1_api, *target, since_seconds=since_seconds)
+                for target in targets
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                namespace, pod_name, container, error = future.result()
+                pod_logs[(namespace, pod_name)].append(container)
+                if error:
+                    errors.append(CollectResult(False, error, f"Pod log {namespace}/{pod_name}/{container}"))
+                progress.update()
         
         progress.complete()
         
     except Exception as e:
         logger.error(f"Error collecting pod logs: {e}")
-        pod_logs["error"] = str(e)
+        errors.append(CollectResult(False, str(e), "Pod logs"))
     
-    return pod_logs
+    return pod_logs, errors, resource_version
 
 def collect_node_metrics(custom_api):
     """Collects node metrics using the Kubernetes metrics API"""
@@ -265,22 +604,54 @@ def collect_node_metrics(custom_api):
         logger.warning(f"Metrics server not available: {e}")
         return {"error": str(e)}
 
-def collect_versions():
-    """Collects version information for cluster components"""
-    versions = {}
-    progress = ProgressTracker(len(VERSION_COMMANDS), "Version collection")
+def read_deployment_image(apps_api, component):
+    """Reads one tracked deployment and returns the images that identify its version"""
+    namespace, name, all_containers = DEPLOYMENT_IMAGES[component]
+    try:
+        deployment = apps_api.read_namespaced_deployment(name, namespace, _request_timeout=30)
+    except client.rest.ApiException as e:
+        if e.status == 404:
+            return CollectResult(False, f"Not available: deployment {name} not found in namespace {namespace}", component)
+        return CollectResult(False, f"Not available: {e}", component)
+    except Exception as e:
+        return CollectResult(False, f"Not available: {e}", component)
     
-    for component, cmd in VERSION_COMMANDS.items():
-        success, output = run_command(cmd, shell=True)
-        versions[component] = output.strip() if success else f"Not available: {output}"
-        progress.update()
+    containers = deployment.spec.template.spec.containers
+    if not all_containers:
+        containers = containers[:1]
+    return CollectResult(True, " ".join(c.image for c in containers), component)
+
+async def collect_deployment_image(apps_api, component):
+    """Reads a tracked deployment image without blocking the event loop"""
+    if not apps_api:
+        return CollectResult(False, "Not available: Kubernetes API client not available", component)
+    # The Kubernetes client is blocking, run it off the event loop
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, read_deployment_image, apps_api, component)
+
+async def gather_versions(apps_api, progress):
+    """Runs all version probes concurrently on one event loop"""
+    results = await asyncio.gather(
+        *(track_progress(run_command_async(cmd), progress) for cmd in VERSION_COMMANDS.values()),
+        *(track_progress(collect_deployment_image(apps_api, component), progress) for component in DEPLOYMENT_IMAGES)
+    )
+    command_results, images = results[:len(VERSION_COMMANDS)], results[len(VERSION_COMMANDS):]
     
+    versions = {}
+    for component, (success, output) in zip(VERSION_COMMANDS, command_results):
+        versions[component] = CollectResult(success, output.strip() if success else f"Not available: {output}", component)
+    versions.update(zip(DEPLOYMENT_IMAGES, images))
+    return versions
+
+def collect_versions(apps_api):
+    """Collects version information for cluster components"""
+    progress = ProgressTracker(len(VERSION_COMMANDS) + len(DEPLOYMENT_IMAGES), "Version collection")
+    versions = asyncio.run(gather_versions(apps_api, progress))
     progress.complete()
     return versions
 
-def save_text_logs(data, base_dir):
-    """Saves collected logs as individual text files in an organized directory structure"""
-    created_files = []
+def create_collection_dir(base_dir):
+    """Creates the timestamped directory structure that collected data is written into"""
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     collection_dir = Path(base_dir) / f"nessie_logs_{timestamp}"
     
@@ -292,77 +663,68 @@ def save_text_logs(data, base_dir):
     (collection_dir / "metrics").mkdir(exist_ok=True)
     (collection_dir / "versions").mkdir(exist_ok=True)
     
-    # Save node logs
+    return collection_dir
+
+def write_file(path, content):
+    """Writes text or bytes to a file with raw os.write calls, skipping the text I/O layer"""
+    if not isinstance(content, bytes):
+        content = str(content).encode("utf-8", "replace")
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def save_text_logs(data, collection_dir):
+    """Saves collected logs as individual text files and returns the number of files per category"""
+    file_counts = Counter()
+    
+    # Node logs are streamed to disk during collection
     if "node_logs" in data and isinstance(data["node_logs"], dict):
-        for service, log_content in data["node_logs"].items():
-            if service == "error":
-                continue
-            log_file = collection_dir / "node" / f"{service}.log"
-            with open(log_file, "w") as f:
-                f.write(str(log_content))
-            created_files.append(log_file)
+        file_counts["node"] += len(data["node_logs"])
     
-    # Save pod logs
+    # Pod logs are streamed to disk during collection
     if "pod_logs" in data and isinstance(data["pod_logs"], dict):
-        for pod_key, containers in data["pod_logs"].items():
-            if pod_key == "error":
-                continue
-                
-            # Create namespace directories
-            if "/" in pod_key:
-                namespace, pod_name = pod_key.split("/", 1)
-                ns_dir = collection_dir / "pods" / namespace
-                ns_dir.mkdir(exist_ok=True)
-                
-                # Save each container's logs
-                for container, log_content in containers.items():
-                    log_file = ns_dir / f"{pod_name}_{container}.log"
-                    with open(log_file, "w") as f:
-                        f.write(str(log_content))
-                    created_files.append(log_file)
+        for containers in data["pod_logs"].values():
+            file_counts["pods"] += len(containers)
     
     # Save K8s configuration information
     if "k8s_configs" in data and isinstance(data["k8s_configs"], dict):
         # Save namespaces list
         if "namespaces" in data["k8s_configs"]:
-            namespaces_file = collection_dir / "configs" / "namespaces.txt"
-            with open(namespaces_file, "w") as f:
-                for ns in data["k8s_configs"]["namespaces"]:
-                    f.write(f"{ns}\n")
-            created_files.append(namespaces_file)
+            namespaces = data["k8s_configs"]["namespaces"]
+            write_file(collection_dir / "configs" / "namespaces.txt", "".join(f"{ns}\n" for ns in namespaces))
+            file_counts["configs"] += 1
         
     # Save Helm releases
         if "helm_releases" in data["k8s_configs"]:
             helm_file = collection_dir / "configs" / "helm_releases.yaml"
             with open(helm_file, "w") as f:
-                yaml.dump(data["k8s_configs"]["helm_releases"], f)
-            created_files.append(helm_file)
+                yaml.dump(data["k8s_configs"]["helm_releases"], f, Dumper=YamlDumper, default_flow_style=False)
+            file_counts["configs"] += 1
             
-        # Save Metal3 logs
+        # Metal3 logs are streamed to disk during collection
         if "metal3_logs" in data["k8s_configs"]:
-            metal3_file = collection_dir / "configs" / "metal3.log"
-            with open(metal3_file, "w") as f:
-                f.write(str(data["k8s_configs"]["metal3_logs"]))
-            created_files.append(metal3_file)
+            file_counts["configs"] += 1
     
     # Save metrics as YAML (more structured)
     if "node_metrics" in data:
         metrics_file = collection_dir / "metrics" / "node_metrics.yaml"
         with open(metrics_file, "w") as f:
-            yaml.dump(data["node_metrics"], f)
-        created_files.append(metrics_file)
+            yaml.dump(data["node_metrics"], f, Dumper=YamlDumper, default_flow_style=False)
+        file_counts["metrics"] += 1
     
     # Save versions as text file
     if "versions" in data and isinstance(data["versions"], dict):
-        versions_file = collection_dir / "versions" / "component_versions.txt"
-        with open(versions_file, "w") as f:
-            for component, version in data["versions"].items():
-                f.write(f"{component}: {version}\n")
-        created_files.append(versions_file)
+        versions = "".join(f"{component}: {result.payload}\n" for component, result in data["versions"].items())
+        write_file(collection_dir / "versions" / "component_versions.txt", versions)
+        file_counts["versions"] += 1
     
-    return created_files, collection_dir
+    return file_counts
 
-def create_summary_report(data, start_time, collection_dir):
+def create_summary_report(data, start_time, collection_dir, file_counts):
     """Creates a summary report of the collected data"""
     logger.info("Creating summary report")
     
@@ -373,6 +735,10 @@ def create_summary_report(data, start_time, collection_dir):
         "NESSIE_MAX_LOG_SIZE": str(MAX_LOG_SIZE // (1024 * 1024)) + " MB",
         "NESSIE_RETENTION_DAYS": RETENTION_DAYS,
         "NESSIE_MAX_POD_LOG_LINES": MAX_POD_LOG_LINES,
+        "NESSIE_LOG_WORKERS": LOG_WORKERS,
+        "NESSIE_WATCH_CACHE": WATCH_CACHE or "Disabled",
+        "NESSIE_LAST_RUN_FILE": LAST_RUN_FILE or "Disabled",
+        "NESSIE_POD_LABEL_SELECTOR": POD_LABEL_SELECTOR or "None",
         "NESSIE_NAMESPACES": ','.join(NAMESPACES_FILTER) if NAMESPACES_FILTER else "All",
         "NESSIE_VERBOSE": VERBOSE,
         "NESSIE_SKIP_NODE_LOGS": SKIP_NODE_LOGS,
@@ -382,11 +748,6 @@ def create_summary_report(data, start_time, collection_dir):
         "NESSIE_SKIP_VERSIONS": SKIP_VERSIONS
     }
     
-    # Count files in each category
-    pod_files = len(list(Path(collection_dir).glob("pods/**/*.log")))
-    node_files = len(list(Path(collection_dir).glob("node/*.log")))
-    config_files = len(list(Path(collection_dir).glob("configs/*")))
-    
     summary = {
         "collection_info": {
             "timestamp": datetime.now().isoformat(),
@@ -404,44 +765,66 @@ def create_summary_report(data, start_time, collection_dir):
         "stats": {
             "namespaces": len(data.get("k8s_configs", {}).get("namespaces", [])),
             "helm_releases": len(data.get("k8s_configs", {}).get("helm_releases", [])) if isinstance(data.get("k8s_configs", {}).get("helm_releases", []), list) else 0,
-            "pod_log_files": pod_files,
-            "node_log_files": node_files,
-            "config_files": config_files,
+            "pod_log_files": file_counts["pods"],
+            "node_log_files": file_counts["node"],
+            "config_files": file_counts["configs"],
             "components_versioned": len(data.get("versions", {}))
         }
     }
     
-    # Collect error information
-    errors = []
-    
-    # Check for node logs errors
-    if isinstance(data.get("node_logs", {}), dict):
-        for service, log in data.get("node_logs", {}).items():
-            if service == "error":
-                errors.append(f"Node logs: {log}")
-            elif isinstance(log, str) and log.startswith("Failed"):
-                errors.append(f"Node service '{service}': {log}")
-    
-    # Check for pod logs errors
-    if isinstance(data.get("pod_logs", {}), dict):
-        if "error" in data["pod_logs"]:
-            errors.append(f"Pod logs: {data['pod_logs']['error']}")
-    
-    # Check for other component errors
-    for component in ["k8s_configs", "node_metrics", "versions"]:
-        if component in data and "error" in data[component]:
-            errors.append(f"{component}: {data[component]['error']}")
-    
-    summary["errors"] = errors
+    # Failures are recorded as they happen during collection
+    summary["errors"] = [f"{result.source}: {result.payload}" for result in data.get("errors", [])]
     
     # Write summary to file
     summary_file = Path(collection_dir) / "summary.yaml"
     with open(summary_file, "w") as f:
-        yaml.dump(summary, f, default_flow_style=False)
+        yaml.dump(summary, f, Dumper=YamlDumper, default_flow_style=False)
     
     logger.info(f"Summary report created at {summary_file}")
     return str(summary_file)
 
+def add_directory_to_tar(tar, directory, arcname):
+    """Adds a directory tree to a tar stream from a single scandir walk
+    
+    Builds each TarInfo from one stat per file, skipping the user and group name
+    lookups tarfile.add performs for every member. Only directories and regular
+    files are archived, Nessie does not write anything else.
+    """
+    info = tarfile.TarInfo(arcname)
+    st = os.stat(directory)
+    info.type, info.mode, info.mtime = tarfile.DIRTYPE, st.st_mode & 0o7777, st.st_mtime
+    info.uid, info.gid = st.st_uid, st.st_gid
+    tar.addfile(info)
+    
+    with os.scandir(directory) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            name = f"{arcname}/{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                add_directory_to_tar(tar, entry.path, name)
+            elif entry.is_file(follow_symlinks=False):
+                st = entry.stat(follow_symlinks=False)
+                info = tarfile.TarInfo(name)
+                info.size, info.mode, info.mtime = st.st_size, st.st_mode & 0o7777, st.st_mtime
+                info.uid, info.gid = st.st_uid, st.st_gid
+                with open(entry.path, "rb") as f:
+                    tar.addfile(info, f)
+            else:
+                logger.debug(f"Not archiving {entry.path}, it is not a regular file or directory")
+
+def compress_with_pigz(pigz, collection_dir, zip_file):
+    """Archives a directory with tarfile and compresses the stream with pigz on all cores"""
+    with open(zip_file, "wb") as out:
+        gz = subprocess.Popen([pigz, "-p", str(os.cpu_count() or 1), "-6"], stdin=subprocess.PIPE, stdout=out)
+        try:
+            with tarfile.open(fileobj=gz.stdin, mode="w|", bufsize=ARCHIVE_BUFFER_SIZE) as tar:
+                add_directory_to_tar(tar, collection_dir, os.path.basename(collection_dir))
+        finally:
+            gz.stdin.close()
+            returncode = gz.wait()
+    
+    if returncode != 0:
+        raise RuntimeError(f"pigz failed with exit code {returncode}")
+
 def zip_logs(collection_dir, zip_dir):
     """Creates a compressed archive of collected logs"""
     logger.info("Creating compressed archive")
@@ -449,8 +832,16 @@ def zip_logs(collection_dir, zip_dir):
     zip_file = Path(zip_dir) / f"nessie_logs_{timestamp}.tar.gz"
     
     try:
-        with tarfile.open(zip_file, "w:gz") as tar:
-            tar.add(collection_dir, arcname=os.path.basename(collection_dir))
+        pigz = find_tool("pigz")
+        if pigz:
+            compress_with_pigz(pigz, collection_dir, zip_file)
+        else:
+            logger.debug("pigz not found, falling back to single-threaded gzip")
+            # Fast compression level and a large write buffer, log text compresses well either way
+            with gzip.GzipFile(zip_file, "wb", compresslevel=1) as gz, \
+                    io.BufferedWriter(gz, buffer_size=ARCHIVE_BUFFER_SIZE) as buffered, \
+                    tarfile.open(fileobj=buffered, mode="w|", bufsize=ARCHIVE_BUFFER_SIZE) as tar:
+                add_directory_to_tar(tar, collection_dir, os.path.basename(collection_dir))
         
         logger.info(f"Archive created at {zip_file}")
         return str(zip_file)
@@ -464,11 +855,12 @@ def enforce_retention():
     deleted_count = 0
     
     try:
-        for path in Path(ZIP_DIR).glob("*.tar.gz"):
-            file_time = datetime.fromtimestamp(path.stat().st_ctime)
-            if datetime.now() - file_time > timedelta(days=RETENTION_DAYS):
-                path.unlink()
-                deleted_count += 1
+        cutoff = time.time() - RETENTION_DAYS * 86400
+        with os.scandir(ZIP_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith(".tar.gz") and entry.stat().st_ctime < cutoff:
+                    os.unlink(entry.path)
+                    deleted_count += 1
         
         logger.info(f"Deleted {deleted_count} old log archives")
     except Exception as e:
@@ -478,16 +870,17 @@ def check_disk_space():
     """Checks available disk space and warns if running low"""
     try:
         usage = shutil.disk_usage(LOG_DIR)
-        free_percent = (usage.free / usage.total) * 100
+        free = usage.free
         
-        if usage.free < 1024 * 1024 * 100:  # Less than 100MB free
-            logger.error(f"Critical: Only {usage.free / (1024*1024):.1f}MB free space remaining!")
+        # Compare in integer bytes, only format sizes for the message that gets logged
+        if free < MIN_FREE_SPACE:
+            logger.error(f"Critical: Only {free / (1024*1024):.1f}MB free space remaining!")
             return False
-        elif free_percent < 10:  # Less than 10% free
-            logger.warning(f"Low disk space: {free_percent:.1f}% ({usage.free / (1024*1024*1024):.1f}GB) free")
+        elif free * 100 < usage.total * LOW_FREE_SPACE_PERCENT:
+            logger.warning(f"Low disk space: {free * 100 / usage.total:.1f}% ({free / (1024*1024*1024):.1f}GB) free")
             return True
         else:
-            logger.info(f"Disk space check: {free_percent:.1f}% ({usage.free / (1024*1024*1024):.1f}GB) free")
+            logger.info(f"Disk space check: {free * 100 / usage.total:.1f}% ({free / (1024*1024*1024):.1f}GB) free")
             return True
     except Exception as e:
         logger.error(f"Error checking disk space: {e}")
@@ -502,8 +895,7 @@ def check_required_tools():
     
     missing_tools = []
     for tool, purpose in tools.items():
-        success, _ = run_command(f"command -v {tool}", shell=True)
-        if not success:
+        if not find_tool(tool):
             missing_tools.append((tool, purpose))
     
     if missing_tools:
@@ -514,6 +906,71 @@ def check_required_tools():
     
     return len(missing_tools) == 0
 
+def parallel_collect_data(v1_api, custom_api, apps_api, collection_dir):
+    """Runs the enabled collectors concurrently and returns the collected data"""
+    # (data key, description, collector) for every collector that should run
+    collectors = []
+    
+    if SKIP_NODE_LOGS:
+        logger.info("Skipping node logs collection")
+    else:
+        collectors.append(("node_logs", "Node log collection", lambda: collect_node_logs(collection_dir)))
+    
+    if SKIP_K8S_CONFIGS:
+        logger.info("Skipping Kubernetes configuration collection")
+    elif not v1_api:
+        logger.error("Kubernetes API client not available, skipping K8s configuration collection")
+    else:
+        collectors.append(("k8s_configs", "Kubernetes configuration collection", lambda: collect_k8s_configs(v1_api, collection_dir)))
+    
+    if SKIP_POD_LOGS:
+        logger.info("Skipping pod logs collection")
+    elif not v1_api:
+        logger.error("Kubernetes API client not available, skipping pod logs collection")
+    else:
+        collectors.append(("pod_logs", "Pod log collection", lambda: collect_pod_logs(v1_api, collection_dir)))
+    
+    if SKIP_METRICS:
+        logger.info("Skipping node metrics collection")
+    elif not custom_api:
+        logger.error("Kubernetes Custom API client not available, skipping node metrics collection")
+    else:
+        collectors.append(("node_metrics", "Node metrics collection", lambda: collect_node_metrics(custom_api)))
+    
+    if SKIP_VERSIONS:
+        logger.info("Skipping version information collection")
+    else:
+        collectors.append(("versions", "Version collection", lambda: collect_versions(apps_api)))
+    
+    data = {"errors": []}
+    if not collectors:
+        return data
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(collectors)) as executor:
+        futures = {executor.submit(collector): (key, description) for key, description, collector in collectors}
+        
+        for future in concurrent.futures.as_completed(futures):
+            key, description = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"{description} failed: {e}")
+                data["errors"].append(CollectResult(False, str(e), description))
+                continue
+            
+            if key == "pod_logs":
+                data["pod_logs"], data["pod_log_errors"], data["pod_resource_version"] = result
+                data["errors"].extend(data["pod_log_errors"])
+            elif key == "node_logs":
+                data[key] = result
+                data["errors"].extend(r for r in result.values() if not r.ok)
+            else:
+                data[key] = result
+                if "error" in result:
+                    data["errors"].append(CollectResult(False, str(result["error"]), key))
+    
+    return data
+
 def main():
     """Orchestrates log collection with fault tolerance"""
     start_time = time.time()
@@ -524,9 +981,6 @@ def main():
     logger.info(f"Configuration: MAX_POD_LOG_LINES={MAX_POD_LOG_LINES}, NAMESPACES_FILTER={NAMESPACES_FILTER}")
     logger.info(f"Skip settings: NODE_LOGS={SKIP_NODE_LOGS}, POD_LOGS={SKIP_POD_LOGS}, K8S_CONFIGS={SKIP_K8S_CONFIGS}, METRICS={SKIP_METRICS}, VERSIONS={SKIP_VERSIONS}")
     
-    # Initialize data dictionary
-    data = {}
-    
     # Check prerequisites (continue even if they fail)
     prerequisites_met = True
     if not ensure_directories():
@@ -540,81 +994,36 @@ def main():
     # Check for required tools
     check_required_tools()
     
-    # Setup Kubernetes clients
-    v1_api, custom_api = setup_kubernetes_client()
-    
-    # Collect node logs if not skipped
-    if not SKIP_NODE_LOGS:
-        try:
-            logger.info("Collecting node logs")
-            data["node_logs"] = collect_node_logs()
-        except Exception as e:
-            logger.error(f"Node log collection failed: {e}")
-            data["node_logs"] = {"error": str(e)}
-    else:
-        logger.info("Skipping node logs collection")
-    
-    # Collect K8s configs if not skipped and API client is available
-    if not SKIP_K8S_CONFIGS and v1_api:
-        try:
-            logger.info("Collecting Kubernetes configurations")
-            data["k8s_configs"] = collect_k8s_configs(v1_api)
-        except Exception as e:
-            logger.error(f"Kubernetes configuration collection failed: {e}")
-            data["k8s_configs"] = {"error": str(e)}
-    elif SKIP_K8S_CONFIGS:
-        logger.info("Skipping Kubernetes configuration collection")
-    else:
-        logger.error("Kubernetes API client not available, skipping K8s configuration collection")
-    
-    # Collect pod logs if not skipped and API client is available
-    if not SKIP_POD_LOGS and v1_api:
-        try:
-            logger.info("Collecting pod logs")
-            data["pod_logs"] = collect_pod_logs(v1_api)
-        except Exception as e:
-            logger.error(f"Pod log collection failed: {e}")
-            data["pod_logs"] = {"error": str(e)}
-    elif SKIP_POD_LOGS:
-        logger.info("Skipping pod logs collection")
-    else:
-        logger.error("Kubernetes API client not available, skipping pod logs collection")
+    # Create the output directory, pod logs are streamed straight into it
+    try:
+        collection_dir = create_collection_dir(LOG_DIR)
+    except Exception as e:
+        logger.error(f"Failed to create collection directory: {e}")
+        return 1
     
-    # Collect node metrics if not skipped and API client is available
-    if not SKIP_METRICS and custom_api:
-        try:
-            logger.info("Collecting node metrics")
-            data["node_metrics"] = collect_node_metrics(custom_api)
-        except Exception as e:
-            logger.error(f"Node metrics collection failed: {e}")
-            data["node_metrics"] = {"error": str(e)}
-    elif SKIP_METRICS:
-        logger.info("Skipping node metrics collection")
-    else:
-        logger.error("Kubernetes Custom API client not available, skipping node metrics collection")
+    # Setup Kubernetes clients
+    api_client, v1_api, custom_api, apps_api = setup_kubernetes_client()
     
-    # Collect version information if not skipped
-    if not SKIP_VERSIONS:
-        try:
-            logger.info("Collecting version information")
-            data["versions"] = collect_versions()
-        except Exception as e:
-            logger.error(f"Version collection failed: {e}")
-            data["versions"] = {"error": str(e)}
-    else:
-        logger.info("Skipping version information collection")
+    # Run all enabled collectors at the same time, then release the API client
+    try:
+        data = parallel_collect_data(v1_api, custom_api, apps_api, collection_dir)
+    finally:
+        if api_client:
+            # close() only stops the client's thread pool, the pooled connections are dropped separately
+            api_client.close()
+            api_client.rest_client.pool_manager.clear()
     
     # Save collected data as individual text files
     try:
-        created_files, collection_dir = save_text_logs(data, LOG_DIR)
-        logger.info(f"Data saved to {collection_dir} ({len(created_files)} files)")
+        file_counts = save_text_logs(data, collection_dir)
+        logger.info(f"Data saved to {collection_dir} ({sum(file_counts.values())} files)")
     except Exception as e:
         logger.error(f"Failed to save log files: {e}")
         return 1
     
     # Create summary report
     try:
-        summary_file = create_summary_report(data, start_time, collection_dir)
+        summary_file = create_summary_report(data, start_time, collection_dir, file_counts)
         logger.info(f"Summary report created at {summary_file}")
     except Exception as e:
         logger.error(f"Failed to create summary report: {e}")
@@ -635,6 +1044,12 @@ def main():
     except Exception as e:
         logger.error(f"Failed to enforce retention policy: {e}")
     
+    # Only advance the incremental state once the pod logs made it into an archive,
+    # otherwise the next run would skip the changes this one failed to deliver
+    if not SKIP_POD_LOGS and "pod_logs" in data and not data.get("pod_log_errors") and archive_file:
+        save_watch_cache(data["pod_resource_version"])
+        save_last_run(start_time)
+    
     # Calculate total execution time
     total_time = time.time() - start_time
     minutes, seconds = divmod(total_time, 60)
@@ -650,19 +1065,15 @@ def main():
     # Content summary
     logger.info("\n📦 COLLECTED CONTENT:")
     if "node_logs" in data:
-        success_count = len([k for k, v in data["node_logs"].items() if not str(v).startswith("Failed")])
+        success_count = sum(1 for r in data["node_logs"].values() if r.ok)
         total_count = len(data["node_logs"])
         logger.info(f"  • System logs: {success_count}/{total_count} services")
     else:
         logger.info("  • System logs: Not collected")
     
-    if "pod_logs" in data and "error" not in data["pod_logs"]:
+    if data.get("pod_logs"):
         pod_count = len(data["pod_logs"])
-        namespaces = set()
-        for pod_key in data["pod_logs"].keys():
-            if "/" in pod_key:
-                namespace = pod_key.split("/")[0]
-                namespaces.add(namespace)
+        namespaces = {namespace for namespace, _ in data["pod_logs"]}
         logger.info(f"  • Pod logs: {pod_count} pods from {len(namespaces)} namespaces")
     else:
         logger.info("  • Pod logs: Not collected")
@@ -676,7 +1087,7 @@ def main():
         logger.info("  • Kubernetes configs: Not collected")
     
     if "versions" in data:
-        version_count = len([v for v in data["versions"].values() if not v.startswith("Not available")])
+        version_count = sum(1 for r in data["versions"].values() if r.ok)
         logger.info(f"  • Component versions: {version_count}/{len(data['versions'])}")
     else:
         logger.info("  • Component versions: Not collected")
@@ -693,12 +1104,15 @@ def main():
     # Any issues or notes
     issues = []
     if "node_logs" in data:
-        failed_services = [k for k, v in data["node_logs"].items() if str(v).startswith("Failed")]
+        failed_services = [k for k, r in data["node_logs"].items() if not r.ok]
         if failed_services:
             issues.append(f"Could not collect logs from: {', '.join(failed_services)}")
     
+    if data.get("pod_log_errors"):
+        issues.append(f"Pod log collection reported {len(data['pod_log_errors'])} errors, see the summary report")
+    
     if "versions" in data:
-        missing_versions = [k for k, v in data["versions"].items() if v.startswith("Not available")]
+        missing_versions = [k for k, r in data["versions"].items() if not r.ok]
         if missing_versions:
             issues.append(f"Missing version information for: {', '.join(missing_versions)}")
     
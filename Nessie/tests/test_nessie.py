@@ -0,0 +1,500 @@
+import io
+import json
+import os
+import stat
+import tarfile
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from kubernetes import client
+
+import nessie
+
+
+def make_pod(namespace, name, containers=("main",)):
+    return SimpleNamespace(
+        metadata=SimpleNamespace(namespace=namespace, name=name),
+        spec=SimpleNamespace(containers=[SimpleNamespace(name=c) for c in containers])
+    )
+
+
+def make_pod_list(pods, continue_token=None, resource_version="100"):
+    return SimpleNamespace(
+        items=pods, metadata=SimpleNamespace(resource_version=resource_version, _continue=continue_token)
+    )
+
+
+def write_script(path, body):
+    path.write_text(f"#!/bin/sh\n{body}\n")
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+
+
+class FakeWatch:
+    """Replays canned watch events, or raises the given exception, like kubernetes.watch.Watch"""
+    events = []
+    error = None
+    final_resource_version = None
+
+    def __init__(self):
+        self.resource_version = None
+
+    def stream(self, func, **kwargs):
+        self.resource_version = kwargs.get("resource_version")
+        if self.error:
+            raise self.error
+        yield from self.events
+        if self.final_resource_version:
+            self.resource_version = self.final_resource_version
+
+
+class FakeLogResponse(io.BytesIO):
+    def release_conn(self):
+        pass
+
+
+def test_collect_pod_logs_fetches_every_container(tmp_path, monkeypatch):
+    monkeypatch.setattr(nessie, "NAMESPACES_FILTER", None)
+    v1_api = mock.Mock()
+    v1_api.list_pod_for_all_namespaces.return_value = make_pod_list(
+        [make_pod("default", "web", ("app", "sidecar")), make_pod("kube-system", "dns")]
+    )
+
+    def read_log(name, namespace, container, **kwargs):
+        if container == "sidecar":
+            raise RuntimeError("connection reset")
+        return FakeLogResponse(f"{namespace}/{name}/{container}\n".encode())
+    v1_api.read_namespaced_pod_log.side_effect = read_log
+
+    pod_logs, errors, resource_version = nessie.collect_pod_logs(v1_api, tmp_path)
+
+    # A failed container is still listed, and its error keeps the run from advancing the last run time
+    assert errors == [nessie.CollectResult(False, "connection reset", "Pod log default/web/sidecar")]
+    assert resource_version == "100"
+    assert {pod: sorted(containers) for pod, containers in pod_logs.items()} == {
+        ("default", "web"): ["app", "sidecar"],
+        ("kube-system", "dns"): ["main"],
+    }
+    pods_dir = tmp_path / "pods"
+    assert (pods_dir / "default" / "web_app.log").read_text() == "default/web/app\n"
+    assert (pods_dir / "default" / "web_sidecar.log").read_text() == "Error: connection reset"
+    assert (pods_dir / "kube-system" / "dns_main.log").read_text() == "kube-system/dns/main\n"
+    for call in v1_api.read_namespaced_pod_log.call_args_list:
+        assert call.kwargs["tail_lines"] == nessie.MAX_POD_LOG_LINES
+
+
+def test_list_pods_follows_continue_tokens(monkeypatch):
+    monkeypatch.setattr(nessie, "NAMESPACES_FILTER", None)
+    first, second = make_pod("default", "a"), make_pod("default", "b")
+    v1_api = mock.Mock()
+    v1_api.list_pod_for_all_namespaces.side_effect = [
+        make_pod_list([first], "token", resource_version="7"),
+        make_pod_list([second], resource_version="8"),
+    ]
+
+    # The resourceVersion of the first page is the snapshot all pages are served from
+    assert nessie.list_pods(v1_api) == ([first, second], "7")
+    first_call, second_call = v1_api.list_pod_for_all_namespaces.call_args_list
+    assert first_call.kwargs["limit"] == nessie.POD_LIST_PAGE_SIZE
+    assert "_continue" not in first_call.kwargs
+    assert second_call.kwargs["_continue"] == "token"
+
+
+def test_list_pods_filters_single_namespace_server_side(monkeypatch):
+    monkeypatch.setattr(nessie, "NAMESPACES_FILTER", ["edge"])
+    pods = [make_pod("edge", "a")]
+    v1_api = mock.Mock()
+    v1_api.list_pod_for_all_namespaces.return_value = make_pod_list(pods)
+
+    assert nessie.list_pods(v1_api) == (pods, "100")
+    assert v1_api.list_pod_for_all_namespaces.call_args.kwargs["field_selector"] == "metadata.namespace=edge"
+
+
+def test_list_pods_filters_several_namespaces_client_side(monkeypatch):
+    monkeypatch.setattr(nessie, "NAMESPACES_FILTER", ["edge", "metal3"])
+    kept, other = make_pod("metal3", "a"), make_pod("default", "b")
+    v1_api = mock.Mock()
+    v1_api.list_pod_for_all_namespaces.return_value = make_pod_list([kept, other])
+
+    assert nessie.list_pods(v1_api) == ([kept], "100")
+    assert "field_selector" not in v1_api.list_pod_for_all_namespaces.call_args.kwargs
+
+
+def test_list_pods_passes_label_selector(monkeypatch):
+    monkeypatch.setattr(nessie, "NAMESPACES_FILTER", ["edge"])
+    monkeypatch.setattr(nessie, "POD_LABEL_SELECTOR", "app=web")
+    v1_api = mock.Mock()
+    v1_api.list_pod_for_all_namespaces.return_value = make_pod_list([])
+
+    nessie.list_pods(v1_api)
+    list_args = v1_api.list_pod_for_all_namespaces.call_args.kwargs
+    assert list_args["label_selector"] == "app=web"
+    assert list_args["field_selector"] == "metadata.namespace=edge"
+    assert list_args["timeout_seconds"] == 30
+
+
+@pytest.fixture
+def fake_journalctl(tmp_path, monkeypatch):
+    """Puts a journalctl on PATH that echoes its arguments and fails for the hauler unit"""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    write_script(bin_dir / "journalctl", "\n".join([
+        'case "$*" in',
+        '  *hauler*) echo "no journal" >&2; exit 1 ;;',
+        'esac',
+        'echo "journalctl $*"',
+    ]))
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+
+def test_collect_node_logs_streams_every_service_to_its_file(fake_journalctl, tmp_path):
+    (tmp_path / "node").mkdir()
+    logs = nessie.collect_node_logs(tmp_path)
+
+    assert list(logs) == list(nessie.NODE_SERVICES)
+    node_dir = tmp_path / "node"
+    assert (node_dir / "system.log").read_text() == "journalctl -n 1000 --no-pager\n"
+    assert (node_dir / "combustion.log").read_text() == "journalctl -u combustion --no-pager\n"
+    assert (node_dir / "nmc.log").read_text() == "journalctl -u nm-configurator --no-pager\n"
+
+
+def test_collect_node_logs_failing_service_does_not_fail_the_others(fake_journalctl, tmp_path):
+    (tmp_path / "node").mkdir()
+    logs = nessie.collect_node_logs(tmp_path)
+
+    hauler = logs["hauler"]
+    assert not hauler.ok
+    assert hauler.source == "Node service 'hauler'"
+    assert hauler.payload.startswith("Failed to collect logs:")
+    assert "no journal" in hauler.payload
+    assert (tmp_path / "node" / "hauler.log").read_text() == hauler.payload
+    assert [name for name, result in logs.items() if not result.ok] == ["hauler"]
+
+
+@pytest.fixture
+def watch_cache(tmp_path, monkeypatch):
+    cache_file = tmp_path / "watch_cache.json"
+    monkeypatch.setattr(nessie, "WATCH_CACHE", str(cache_file))
+    monkeypatch.setattr(nessie, "NAMESPACES_FILTER", None)
+    monkeypatch.setattr(nessie.watch, "Watch", FakeWatch)
+    FakeWatch.events, FakeWatch.error, FakeWatch.final_resource_version = [], None, None
+    return cache_file
+
+
+def test_list_changed_pods_without_cache_lists_all_pods(watch_cache):
+    v1_api = mock.Mock()
+    pods = [make_pod("default", "a"), make_pod("kube-system", "b")]
+    v1_api.list_pod_for_all_namespaces.return_value = make_pod_list(pods, resource_version="42")
+
+    assert nessie.list_changed_pods(v1_api) == (pods, "42")
+    assert not watch_cache.exists()
+
+
+def test_list_changed_pods_replays_watch_from_cached_version(watch_cache):
+    nessie.save_watch_cache("42")
+    changed, deleted = make_pod("default", "changed"), make_pod("default", "deleted")
+    FakeWatch.events = [
+        {"type": "ADDED", "object": deleted},
+        {"type": "MODIFIED", "object": changed},
+        {"type": "BOOKMARK", "object": None},
+        {"type": "DELETED", "object": deleted},
+    ]
+    FakeWatch.final_resource_version = "57"
+    v1_api = mock.Mock()
+
+    assert nessie.list_changed_pods(v1_api) == ([changed], "57")
+    v1_api.list_pod_for_all_namespaces.assert_not_called()
+    # The cache is only advanced by main() once the whole run has succeeded
+    assert json.loads(watch_cache.read_text()) == {"resource_version": "42"}
+
+
+def test_list_changed_pods_warns_that_unchanged_pods_are_skipped(watch_cache, caplog):
+    nessie.save_watch_cache("42")
+    FakeWatch.final_resource_version = "57"
+
+    nessie.list_changed_pods(mock.Mock())
+
+    assert "skipping logs of pods that did not change" in caplog.text
+
+
+def test_list_changed_pods_falls_back_to_full_list_on_410(watch_cache):
+    nessie.save_watch_cache("42")
+    FakeWatch.error = client.rest.ApiException(status=410, reason="Gone")
+    v1_api = mock.Mock()
+    pods = [make_pod("default", "a")]
+    v1_api.list_pod_for_all_namespaces.return_value = make_pod_list(pods, resource_version="99")
+
+    assert nessie.list_changed_pods(v1_api) == (pods, "99")
+
+
+def test_list_changed_pods_raises_other_api_errors(watch_cache):
+    nessie.save_watch_cache("42")
+    FakeWatch.error = client.rest.ApiException(status=403, reason="Forbidden")
+
+    with pytest.raises(client.rest.ApiException):
+        nessie.list_changed_pods(mock.Mock())
+
+
+def test_load_watch_cache_accepts_old_cache_files(watch_cache):
+    watch_cache.write_text(json.dumps({"resource_version": "42", "pods": ["default/a"]}))
+
+    assert nessie.load_watch_cache() == "42"
+
+
+@pytest.fixture
+def collection_dir(tmp_path):
+    collection_dir = tmp_path / "nessie_logs_2024-01-01_00-00-00"
+    (collection_dir / "node").mkdir(parents=True)
+    (collection_dir / "node" / "system.log").write_text("system log\n")
+    (collection_dir / "pods" / "default").mkdir(parents=True)
+    (collection_dir / "pods" / "default" / "web_app.log").write_text("pod log\n")
+    return collection_dir
+
+
+def archive_members(archive_file):
+    with tarfile.open(archive_file, "r:gz") as tar:
+        return {member.name: tar.extractfile(member).read() if member.isfile() else None for member in tar}
+
+
+@pytest.mark.parametrize("use_pigz", [True, False], ids=["pigz", "gzip"])
+def test_zip_logs_archives_collection_dir(tmp_path, collection_dir, monkeypatch, use_pigz):
+    pigz = None
+    if use_pigz:
+        # Stand-in for pigz that accepts its arguments and compresses stdin
+        pigz = tmp_path / "pigz"
+        write_script(pigz, "exec gzip -c")
+    monkeypatch.setattr(nessie, "find_tool", lambda name: str(pigz) if pigz else None)
+    zip_dir = tmp_path / "archives"
+    zip_dir.mkdir()
+
+    archive_file = nessie.zip_logs(collection_dir, zip_dir)
+
+    assert archive_file and os.path.dirname(archive_file) == str(zip_dir)
+    root = collection_dir.name
+    assert archive_members(archive_file) == {
+        root: None,
+        f"{root}/node": None,
+        f"{root}/node/system.log": b"system log\n",
+        f"{root}/pods": None,
+        f"{root}/pods/default": None,
+        f"{root}/pods/default/web_app.log": b"pod log\n",
+    }
+
+
+def test_list_namespace_names_requests_metadata_only_pages():
+    v1_api = mock.Mock()
+    v1_api.api_client.call_api.side_effect = [
+        SimpleNamespace(data=json.dumps({"items": [{"metadata": {"name": "default"}}], "metadata": {"continue": "token"}})),
+        SimpleNamespace(data=json.dumps({"items": [{"metadata": {"name": "edge"}}], "metadata": {}})),
+    ]
+
+    assert nessie.list_namespace_names(v1_api) == ["default", "edge"]
+    first_call, second_call = v1_api.api_client.call_api.call_args_list
+    assert first_call.args == ("/api/v1/namespaces", "GET")
+    assert first_call.kwargs["header_params"] == {
+        "Accept": nessie.PARTIAL_METADATA_ACCEPT,
+        "Accept-Encoding": "gzip",
+    }
+    assert first_call.kwargs["query_params"] == [("limit", nessie.NAMESPACE_LIST_PAGE_SIZE)]
+    assert second_call.kwargs["query_params"] == [("limit", nessie.NAMESPACE_LIST_PAGE_SIZE), ("continue", "token")]
+
+
+@pytest.mark.parametrize("age_days, deleted", [(29, False), (31, True)])
+def test_enforce_retention_deletes_only_expired_archives(tmp_path, monkeypatch, age_days, deleted):
+    archive = tmp_path / "nessie_logs_2024-01-01_00-00-00.tar.gz"
+    archive.write_bytes(b"")
+    other = tmp_path / "notes.txt"
+    other.write_text("keep me\n")
+    monkeypatch.setattr(nessie, "ZIP_DIR", str(tmp_path))
+    monkeypatch.setattr(nessie, "RETENTION_DAYS", 30)
+    now = time.time()
+    monkeypatch.setattr(nessie.time, "time", lambda: now + age_days * 86400)
+
+    nessie.enforce_retention()
+
+    assert archive.exists() != deleted
+    assert other.exists()
+
+
+def test_run_command_async_reports_output_and_failures():
+    assert nessie.asyncio.run(nessie.run_command_async(["echo", "hello"])) == (True, "hello\n")
+    success, output = nessie.asyncio.run(nessie.run_command_async(["sh", "-c", "echo oops >&2; exit 3"]))
+    assert not success
+    assert output == "Command failed with code 3: oops\n"
+    success, output = nessie.asyncio.run(nessie.run_command_async(["sleep", "5"], timeout=0.1))
+    assert (success, output) == (False, "Command timed out after 0.1 seconds")
+
+
+def test_last_run_file_round_trip(tmp_path, monkeypatch):
+    last_run = tmp_path / "state" / "last_run"
+    monkeypatch.setattr(nessie, "LAST_RUN_FILE", str(last_run))
+    assert nessie.load_last_run() is None
+    nessie.save_last_run(1700000000.5)
+    assert nessie.load_last_run() == 1700000000.5
+
+
+def test_last_run_file_ignored_when_unreadable_or_disabled(tmp_path, monkeypatch):
+    last_run = tmp_path / "last_run"
+    last_run.write_text("not a timestamp\n")
+    monkeypatch.setattr(nessie, "LAST_RUN_FILE", str(last_run))
+    assert nessie.load_last_run() is None
+    monkeypatch.setattr(nessie, "LAST_RUN_FILE", "")
+    nessie.save_last_run(1700000000.5)
+    assert nessie.load_last_run() is None
+    assert last_run.read_text() == "not a timestamp\n"
+
+
+def test_collect_pod_logs_sends_since_seconds_after_a_previous_run(tmp_path, monkeypatch):
+    last_run = tmp_path / "last_run"
+    last_run.write_text("1000\n")
+    monkeypatch.setattr(nessie, "LAST_RUN_FILE", str(last_run))
+    monkeypatch.setattr(nessie, "WATCH_CACHE", "")
+    monkeypatch.setattr(nessie.time, "time", lambda: 1060.0)
+    monkeypatch.setattr(nessie, "list_pods", lambda v1_api: ([make_pod("default", "web")], "1"))
+    v1_api = mock.Mock()
+    v1_api.read_namespaced_pod_log.return_value = FakeLogResponse(b"line\n")
+
+    nessie.collect_pod_logs(v1_api, tmp_path)
+
+    assert v1_api.read_namespaced_pod_log.call_args.kwargs["since_seconds"] == 60
+    assert v1_api.read_namespaced_pod_log.call_args.kwargs["tail_lines"] == nessie.MAX_POD_LOG_LINES
+
+
+def make_deployment(namespace, name, images):
+    return client.V1Deployment(
+        metadata=client.V1ObjectMeta(namespace=namespace, name=name),
+        spec=client.V1DeploymentSpec(
+            selector=client.V1LabelSelector(),
+            template=client.V1PodTemplateSpec(
+                spec=client.V1PodSpec(
+                    containers=[client.V1Container(name=f"c{i}", image=image) for i, image in enumerate(images)]
+                )
+            ),
+        ),
+    )
+
+
+def fake_apps_api(deployments):
+    """AppsV1Api stand-in serving the given deployments by (namespace, name), 404 for the rest"""
+    def read_namespaced_deployment(name, namespace, **kwargs):
+        if (namespace, name) not in deployments:
+            raise client.rest.ApiException(status=404, reason="Not Found")
+        return deployments[(namespace, name)]
+    apps_api = mock.Mock()
+    apps_api.read_namespaced_deployment.side_effect = read_namespaced_deployment
+    return apps_api
+
+
+def test_collect_versions_combines_probes_and_deployment_images(monkeypatch):
+    monkeypatch.setattr(nessie, "VERSION_COMMANDS", {"helm": ["echo", "v3.14.0"], "kubectl": ["false"]})
+    apps_api = fake_apps_api({
+        ("cattle-system", "system-upgrade-controller"):
+            make_deployment("cattle-system", "system-upgrade-controller", ["suc:1.0", "kubectl:1.29"]),
+        ("metallb-system", "metallb-controller"):
+            make_deployment("metallb-system", "metallb-controller", ["controller:0.14", "speaker:0.14"]),
+    })
+
+    versions = nessie.collect_versions(apps_api)
+
+    assert list(versions) == [*nessie.VERSION_COMMANDS, *nessie.DEPLOYMENT_IMAGES]
+    assert versions["helm"] == nessie.CollectResult(True, "v3.14.0", "helm")
+    assert versions["upgrade-controller"] == nessie.CollectResult(True, "suc:1.0", "upgrade-controller")
+    assert versions["metallb"] == nessie.CollectResult(True, "controller:0.14 speaker:0.14", "metallb")
+    assert not versions["kubectl"].ok
+    assert versions["kubectl"].payload.startswith("Not available: Command failed with code 1")
+    assert apps_api.read_namespaced_deployment.call_count == len(nessie.DEPLOYMENT_IMAGES)
+
+
+def test_read_deployment_image_reports_missing_and_failing_reads():
+    apps_api = fake_apps_api({})
+    assert nessie.read_deployment_image(apps_api, "endpoint-copier-operator") == nessie.CollectResult(
+        False,
+        "Not available: deployment endpoint-copier-operator not found in namespace endpoint-copier-operator",
+        "endpoint-copier-operator",
+    )
+
+    apps_api.read_namespaced_deployment.side_effect = client.rest.ApiException(status=403, reason="Forbidden")
+    result = nessie.read_deployment_image(apps_api, "metallb")
+    assert not result.ok
+    assert result.payload.startswith("Not available: (403)")
+
+
+def test_collect_versions_without_api_client(monkeypatch):
+    monkeypatch.setattr(nessie, "VERSION_COMMANDS", {})
+
+    versions = nessie.collect_versions(None)
+
+    assert {result.payload for result in versions.values()} == {"Not available: Kubernetes API client not available"}
+
+
+def test_progress_tracker_logs_every_step_or_interval(monkeypatch, caplog):
+    now = [1000.0]
+    monkeypatch.setattr(nessie.time, "time", lambda: now[0])
+    caplog.set_level("INFO", logger=nessie.logger.name)
+
+    progress = nessie.ProgressTracker(100, "Test")
+    for _ in range(100):
+        progress.update()
+    progress_lines = [r.getMessage() for r in caplog.records if "progress:" in r.getMessage()]
+    assert len(progress_lines) == 20
+    assert progress_lines[0].startswith("Test progress: 5/100")
+    assert progress_lines[-1].startswith("Test progress: 100/100")
+
+    caplog.clear()
+    progress = nessie.ProgressTracker(100, "Slow")
+    progress.update()
+    now[0] += nessie.ProgressTracker.LOG_INTERVAL
+    progress.update()
+    assert [r.getMessage() for r in caplog.records if "progress:" in r.getMessage()] == [
+        "Slow progress: 2/100 (2.0%) - 1.0s elapsed"
+    ]
+
+
+def test_add_directory_to_tar_keeps_file_metadata(collection_dir):
+    log_file = collection_dir / "node" / "system.log"
+    os.chmod(log_file, 0o640)
+    os.utime(log_file, (1700000000, 1700000000))
+    buffer = io.BytesIO()
+
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        nessie.add_directory_to_tar(tar, collection_dir, collection_dir.name)
+
+    buffer.seek(0)
+    with tarfile.open(fileobj=buffer) as tar:
+        member = tar.getmember(f"{collection_dir.name}/node/system.log")
+        assert member.isfile()
+        assert member.size == log_file.stat().st_size
+        assert member.mode == 0o640
+        assert member.mtime == 1700000000
+        assert tar.extractfile(member).read() == log_file.read_bytes()
+        assert tar.getmember(f"{collection_dir.name}/pods/default").isdir()
+
+
+@pytest.mark.parametrize("free, total, expected, level", [
+    (50 * 1024 * 1024, 100 * 1024 ** 3, False, "ERROR"),
+    (5 * 1024 ** 3, 100 * 1024 ** 3, True, "WARNING"),
+    (50 * 1024 ** 3, 100 * 1024 ** 3, True, "INFO"),
+])
+def test_check_disk_space_thresholds(monkeypatch, caplog, free, total, expected, level):
+    usage = SimpleNamespace(total=total, used=total - free, free=free)
+    monkeypatch.setattr(nessie.shutil, "disk_usage", lambda path: usage)
+    caplog.set_level("INFO", logger=nessie.logger.name)
+
+    assert nessie.check_disk_space() is expected
+    assert [record.levelname for record in caplog.records] == [level]
+
+
+def test_add_directory_to_tar_skips_symlinks(collection_dir, caplog):
+    link = collection_dir / "node" / "link.log"
+    link.symlink_to(collection_dir / "node" / "system.log")
+    caplog.set_level("DEBUG", logger=nessie.logger.name)
+    buffer = io.BytesIO()
+
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        nessie.add_directory_to_tar(tar, collection_dir, collection_dir.name)
+
+    buffer.seek(0)
+    with tarfile.open(fileobj=buffer) as tar:
+        assert f"{collection_dir.name}/node/link.log" not in tar.getnames()
+    assert f"Not archiving {link}" in caplog.text